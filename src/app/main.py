@@ -1,11 +1,13 @@
-from fastapi import FastAPI, Query, HTTPException, Body, Request
+from fastapi import FastAPI, Query, HTTPException, Body, Request, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from typing import Any, Dict, Optional
 import os
 from src.s1_client.client import ScholarOneAPI, S1Error
 from src.core.constants import ALLOWED_SITES
 from src.integrations.scholarone.proxy import call_named_endpoint
-from src.integrations.scholarone.endpoints import ENDPOINTS
+from src.integrations.scholarone.endpoints import ENDPOINTS, DEFAULT_MAX_AGE, DEFAULT_CACHE_SCOPE
+from src.core.http_cache import dump_json, etag_source, make_etag, etag_matches, cache_control, encode_body
 
 app = FastAPI(title="ScholarOne API Wrapper")
 
@@ -38,6 +40,27 @@ def _resolve_site(site_name: str | None) -> str:
         raise HTTPException(400, f"Invalid site_name '{site}'. Must be one of: {', '.join(ALLOWED_SITES)}")
     return site
 
+def _json_response(request: Request, payload: Any, endpoint: str | None = None) -> Response:
+    """JSON response with compression; GETs also get ETag/304 and Cache-Control from ENDPOINTS."""
+    payload = jsonable_encoder(payload)
+    body = dump_json(payload)
+    headers = {"Vary": "Accept-Encoding"}
+    if request.method == "GET":
+        defn = ENDPOINTS.get(endpoint or "", {})
+        etag = make_etag(dump_json(etag_source(payload)))
+        headers["ETag"] = etag
+        headers["Cache-Control"] = cache_control(
+            defn.get("max_age", DEFAULT_MAX_AGE), defn.get("cache_scope", DEFAULT_CACHE_SCOPE)
+        )
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+    else:
+        headers["Cache-Control"] = "no-store"
+    content, encoding = encode_body(body, request.headers.get("accept-encoding"))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type="application/json", headers=headers)
+
 def _shape_basic(data: dict) -> list[SubmissionBasic]:
     r = data.get("Response", {})
     result = r.get("result")
@@ -63,7 +86,8 @@ def _shape_basic(data: dict) -> list[SubmissionBasic]:
     return items
 
 @app.get("/v1/submissions/basic", response_model=BasicSubmissionsResponse)
-def submissions_basic(ids: str = Query(..., description="Comma-separated Submission IDs"),
+def submissions_basic(request: Request,
+                      ids: str = Query(..., description="Comma-separated Submission IDs"),
                       site_name: str | None = None):
     try:
         site = _resolve_site(site_name)
@@ -72,7 +96,8 @@ def submissions_basic(ids: str = Query(..., description="Comma-separated Submiss
         if not id_list:
             raise HTTPException(400, "No valid IDs provided")
         data = client.get_submission_info_basic(site, id_list, id_type="submissionids")
-        return {"items": _shape_basic(data), "raw": data}
+        shaped = BasicSubmissionsResponse(items=_shape_basic(data), raw=data)
+        return _json_response(request, shaped, "submissions_basic_by_ids")
     except HTTPException:
         raise
     except S1Error as e:
@@ -107,7 +132,7 @@ async def s1_named_get(
     params = dict(request.query_params)
     params.pop("site_name", None)
     data = call_named_endpoint(name, site, params)
-    return {"raw": data}
+    return _json_response(request, {"raw": data}, name)
 
 @app.post("/v1/s1/{name}", response_model=ProxyResponse)
 async def s1_named_post(
@@ -129,4 +154,4 @@ async def s1_named_post(
     params = dict(request.query_params)
     params.pop("site_name", None)
     data = call_named_endpoint(name, site, params, body)
-    return {"raw": data}
+    return _json_response(request, {"raw": data}, name)
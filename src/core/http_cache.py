@@ -0,0 +1,123 @@
+from __future__ import annotations
+import gzip
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# brotli / zstd are optional: negotiated only when the package is installed
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+# bodies smaller than this are sent as-is; compressing them costs more than it saves
+COMPRESS_MIN_BYTES = int(os.getenv("S1_COMPRESS_MIN_BYTES", "1024"))
+
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": lambda b: gzip.compress(b, compresslevel=6, mtime=0),
+}
+if brotli is not None:
+    _COMPRESSORS["br"] = lambda b: brotli.compress(b, quality=7)
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = lambda b: zstandard.ZstdCompressor(level=3).compress(b)
+
+# per-call ScholarOne envelope fields: they change on every call even when the data does not
+_ENVELOPE_KEYS = ("callID", "profileCallId")
+
+# server preference when the client weighs several encodings equally;
+# smallest output first at the levels above (see docs/measure_compression.py)
+_PREFERENCE = ("br", "gzip", "zstd")
+
+
+def dump_json(payload: Any) -> bytes:
+    """Compact JSON, keeping upstream key order."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def etag_source(payload: Any) -> Any:
+    """Copy of a ``{"raw": {"Response": ...}}`` payload without the per-call envelope fields."""
+    if not isinstance(payload, dict):
+        return payload
+    raw = payload.get("raw")
+    resp = raw.get("Response") if isinstance(raw, dict) else None
+    if not isinstance(resp, dict):
+        return payload
+    resp = {k: v for k, v in resp.items() if k not in _ENVELOPE_KEYS}
+    return {**payload, "raw": {**raw, "Response": resp}}
+
+
+def make_etag(body: bytes) -> str:
+    # weak: the same entity may go out gzip/br/zstd encoded or identity
+    return 'W/"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+
+def cache_control(max_age: int, scope: str = "private") -> str:
+    if max_age <= 0:
+        return f"{scope}, no-cache"
+    return f"{scope}, max-age={max_age}, must-revalidate"
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() != "q":
+                continue
+            try:
+                q = min(max(float(value.strip()), 0.0), 1.0)
+            except ValueError:
+                q = 0.0
+        weights[token] = q
+    return weights
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best available encoding the client accepts, or None for identity."""
+    if not accept_encoding:
+        return None
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for enc in _PREFERENCE:
+        if enc not in _COMPRESSORS:
+            continue
+        q = weights.get(enc, wildcard)
+        if q > best_q:
+            best, best_q = enc, q
+    return best
+
+
+def encode_body(body: bytes, accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    if len(body) < COMPRESS_MIN_BYTES:
+        return body, None
+    enc = choose_encoding(accept_encoding)
+    if enc is None:
+        return body, None
+    return _COMPRESSORS[enc](body), enc
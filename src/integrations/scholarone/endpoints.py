@@ -2,6 +2,11 @@ from __future__ import annotations
 from typing import Dict, Literal, TypedDict
 
 Method = Literal["GET", "POST"]
+CacheScope = Literal["public", "private"]
+
+# seconds a client/proxy may reuse a response before revalidating (ETag -> 304)
+DEFAULT_MAX_AGE = 0
+DEFAULT_CACHE_SCOPE: CacheScope = "private"
 
 class EndpointDef(TypedDict, total=False):
     path: str
@@ -9,6 +14,8 @@ class EndpointDef(TypedDict, total=False):
     required_params: list[str]
     optional_params: list[str]
     notes: str
+    max_age: int
+    cache_scope: CacheScope
 
 ENDPOINTS: Dict[str, EndpointDef] = {
     "person_full_by_email": {
@@ -17,6 +24,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["primary_email", "_type"],
         "optional_params": [],
         "notes": "Full person record by primary email",
+        "max_age": 300,
     },
     "submissions_basic_by_ids": {
         "path": "/api/s1m/v3/submissions/basic/metadata/submissionids",
@@ -24,6 +32,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "ids must be quoted, comma-separated",
+        "max_age": 120,
     },
     "submission_full_by_documentids": {
         "path": "/api/s1m/v9/submissions/full/metadata/documentids",
@@ -31,6 +40,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Full submission info by document IDs",
+        "max_age": 120,
     },
     "submission_full_by_submissionids": {
         "path": "/api/s1m/v9/submissions/full/metadata/submissionids",
@@ -38,6 +48,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Full submission info by submission IDs",
+        "max_age": 120,
     },
     "metadatainfo_by_documentids": {
         "path": "/api/s1m/v3/submissions/full/metadatainfo/documentids",
@@ -45,6 +56,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Metadata info by document IDs",
+        "max_age": 120,
     },
     "metadatainfo_by_submissionids": {
         "path": "/api/s1m/v3/submissions/full/metadatainfo/submissionids",
@@ -52,6 +64,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Metadata info by submission IDs",
+        "max_age": 120,
     },
     "ids_by_date": {
         "path": "/api/s1m/v4/submissions/full/idsByDate",
@@ -59,6 +72,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["from_time", "to_time", "_type"],
         "optional_params": ["role_type", "custom_question", "Locale ID", "External ID"],
         "notes": "Returns document IDs in a UTC time range; app converts common date formats to UTC Z",
+        "max_age": 60,
     },
     "author_full_by_documentids": {
         "path": "/api/s1m/v3/submissions/full/contributors/authors/documentids",
@@ -66,6 +80,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Author info by document IDs",
+        "max_age": 120,
     },
     "author_full_by_submissionids": {
         "path": "/api/s1m/v3/submissions/full/contributors/authors/submissionids",
@@ -73,6 +88,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Author info by submission IDs",
+        "max_age": 120,
     },
     "reviewer_full_by_documentids": {
         "path": "/api/s1m/v2/submissions/full/reviewer/documentids",
@@ -80,6 +96,7 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Reviewer info by document IDs",
+        "max_age": 120,
     },
     "reviewer_full_by_submissionids": {
         "path": "/api/s1m/v2/submissions/full/reviewer/submissionids",
@@ -87,5 +104,6 @@ ENDPOINTS: Dict[str, EndpointDef] = {
         "required_params": ["ids", "_type"],
         "optional_params": [],
         "notes": "Reviewer info by submission IDs",
+        "max_age": 120,
     },
 }
@@ -0,0 +1,102 @@
+import asyncio
+import gzip
+import json
+
+from starlette.requests import Request
+
+from src.app import main
+from src.core import http_cache
+from src.integrations.scholarone.endpoints import ENDPOINTS
+
+
+def _request(method="GET", path="/v1/s1/submission_full_by_submissionids", query="site_name=ms&ids=MS-1", headers=None):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+    }
+    return Request(scope)
+
+
+def _upstream(call_id="63631fe1-7378-4cc1-ab18-87c06c2eff58", n=1):
+    return {"Response": {"Status": "SUCCESS", "callID": call_id, "profileCallId": "111111",
+                         "result": [{"submissionId": f"MS-{i}", "submissionTitle": "Pricing under uncertainty",
+                                     "submissionStatus": {"documentStatusName": "Under Review",
+                                                          "decisionName": "", "inDraftFlag": False}}
+                                    for i in range(n)]}}
+
+
+def _get_named(monkeypatch, data, headers=None):
+    monkeypatch.setattr(main, "call_named_endpoint", lambda name, site, params, body=None: data)
+    request = _request(headers=headers)
+    return asyncio.run(main.s1_named_get("submission_full_by_submissionids", request, site_name="ms"))
+
+
+def test_get_sets_etag_cache_control_and_vary(monkeypatch):
+    resp = _get_named(monkeypatch, _upstream())
+    assert resp.status_code == 200
+    assert resp.headers["etag"].startswith('W/"')
+    max_age = ENDPOINTS["submission_full_by_submissionids"]["max_age"]
+    assert resp.headers["cache-control"] == f"private, max-age={max_age}, must-revalidate"
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert json.loads(resp.body) == {"raw": _upstream()}
+
+
+def test_get_matching_if_none_match_returns_304_across_call_ids(monkeypatch):
+    first = _get_named(monkeypatch, _upstream(call_id="aaaa"))
+    second = _get_named(monkeypatch, _upstream(call_id="bbbb"), headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert second.body == b""
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == first.headers["cache-control"]
+    assert second.headers["vary"] == "Accept-Encoding"
+
+
+def test_get_changed_data_is_not_304(monkeypatch):
+    first = _get_named(monkeypatch, _upstream(n=1))
+    second = _get_named(monkeypatch, _upstream(n=2), headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_post_is_no_store_without_etag(monkeypatch):
+    monkeypatch.setattr(main, "call_named_endpoint", lambda name, site, params, body=None: _upstream())
+    request = _request(method="POST")
+    resp = asyncio.run(main.s1_named_post("submission_full_by_submissionids", request, body={}, site_name="ms"))
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "no-store"
+    assert "etag" not in resp.headers
+
+
+def test_content_encoding_only_above_threshold(monkeypatch):
+    small = _get_named(monkeypatch, _upstream(n=1), headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    monkeypatch.setattr(http_cache, "COMPRESS_MIN_BYTES", 64)
+    big = _get_named(monkeypatch, _upstream(n=50), headers={"Accept-Encoding": "gzip"})
+    assert big.headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(big.body)) == {"raw": _upstream(n=50)}
+
+    identity = _get_named(monkeypatch, _upstream(n=50))
+    assert "content-encoding" not in identity.headers
+
+
+def test_submissions_basic_keeps_response_shape(monkeypatch):
+    class FakeClient:
+        def get_submission_info_basic(self, site, ids, id_type):
+            return _upstream(n=2)
+
+    monkeypatch.setattr(main, "ScholarOneAPI", FakeClient)
+    request = _request(path="/v1/submissions/basic", query="ids=MS-0,MS-1&site_name=ms")
+    resp = main.submissions_basic(request, ids="MS-0,MS-1", site_name="ms")
+    body = json.loads(resp.body)
+    assert main.BasicSubmissionsResponse.model_validate(body)
+    assert set(body) == {"items", "raw"}
+    assert set(body["items"][0]) == set(main.SubmissionBasic.model_fields)
+    assert body["items"][0]["submissionId"] == "MS-0"
+    assert body["items"][0]["status"] == "Under Review"
+    assert body["raw"] == _upstream(n=2)
+    max_age = ENDPOINTS["submissions_basic_by_ids"]["max_age"]
+    assert resp.headers["cache-control"] == f"private, max-age={max_age}, must-revalidate"
@@ -0,0 +1,64 @@
+import gzip
+
+from src.core import http_cache
+from src.core.http_cache import (
+    cache_control, choose_encoding, dump_json, encode_body, etag_matches, etag_source, make_etag,
+)
+
+
+def test_etag_stable_and_content_sensitive():
+    a = dump_json({"raw": {"Response": {"result": [1, 2, 3]}}})
+    b = dump_json({"raw": {"Response": {"result": [1, 2, 4]}}})
+    assert make_etag(a) == make_etag(a)
+    assert make_etag(a) != make_etag(b)
+
+
+def test_etag_ignores_per_call_envelope():
+    def envelope(call_id, profile_call_id):
+        return {"raw": {"Response": {"Status": "SUCCESS", "callID": call_id,
+                                     "profileCallId": profile_call_id, "result": [{"submissionId": "MS-1"}]}}}
+    a = etag_source(envelope("63631fe1-7378-4cc1-ab18-87c06c2eff58", "111111"))
+    b = etag_source(envelope("0b9f2c7e-1d2a-4c55-9e1f-3a7d8c6b5e41", "222222"))
+    assert make_etag(dump_json(a)) == make_etag(dump_json(b))
+    assert "callID" not in a["raw"]["Response"]
+
+
+def test_etag_matches_weak_list_and_wildcard():
+    etag = make_etag(b"{}")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag[2:]}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_cache_control():
+    assert cache_control(120) == "private, max-age=120, must-revalidate"
+    assert cache_control(0, "public") == "public, no-cache"
+
+
+def test_choose_encoding_respects_q_values():
+    assert choose_encoding(None) is None
+    assert choose_encoding("identity") is None
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("*") in ("zstd", "br", "gzip")
+
+
+def test_choose_encoding_q_anywhere_case_insensitive_clamped():
+    assert choose_encoding("gzip;level=1;q=0") is None
+    assert choose_encoding("GZIP;Q=0") is None
+    assert choose_encoding("gzip; q=0.0") is None
+    assert choose_encoding("gzip;q=-1") is None
+    assert choose_encoding("gzip;q=5") == "gzip"
+
+
+def test_encode_body_threshold():
+    small = b"{}"
+    assert encode_body(small, "gzip") == (small, None)
+    big = dump_json({"raw": [{"submissionId": f"MS-{i}", "status": "Under Review"} for i in range(200)]})
+    assert len(big) >= http_cache.COMPRESS_MIN_BYTES
+    content, enc = encode_body(big, "gzip")
+    assert enc == "gzip"
+    assert gzip.decompress(content) == big
+    assert len(content) < len(big)